@@ -1,17 +1,76 @@
 import boto3
 import getpass
+import json
+import os
+import time
+from pathlib import Path
+
+REGION = 'us-east-1'
+
+# Refresh tokens are cached locally so repeat runs can use REFRESH_TOKEN_AUTH
+# instead of a full USER_PASSWORD_AUTH login.
+CACHE_PATH = Path.home() / ".config" / "agentcore-auth" / "token_cache.json"
+REFRESH_TOKEN_TTL = 30 * 24 * 3600  # Cognito app client default (30 days)
+
+# Shared Cognito client
+client = boto3.client('cognito-idp', region_name=REGION)
+
+
+def _load_cached_refresh_token(client_id):
+    try:
+        cache = json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+    if cache.get("client_id") != client_id or cache.get("expires_at", 0) <= time.time():
+        return None
+    return cache.get("refresh_token")
+
+
+def _save_refresh_token(client_id, refresh_token):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Create the file with 0600 permissions; it holds a credential
+    fd = os.open(CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({
+            "client_id": client_id,
+            "refresh_token": refresh_token,
+            "expires_at": time.time() + REFRESH_TOKEN_TTL,
+        }, f)
 
-def get_bearer_token():
-    region = 'us-east-1'
 
+def _clear_cache():
+    try:
+        CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def get_bearer_token():
     # Prompt user for Cognito details
     client_id = input("Enter Cognito App Client ID (no secret): ")
+
+    refresh_token = _load_cached_refresh_token(client_id)
+    if refresh_token:
+        try:
+            response = client.initiate_auth(
+                ClientId=client_id,
+                AuthFlow='REFRESH_TOKEN_AUTH',
+                AuthParameters={'REFRESH_TOKEN': refresh_token}
+            )
+            token = response['AuthenticationResult']['AccessToken']
+            print("\n✅ Authentication successful (cached refresh token).")
+            print(f"Bearer Token (AccessToken):\n{token}")
+            return
+        except client.exceptions.NotAuthorizedException:
+            # Refresh token expired or revoked; fall back to username/password
+            _clear_cache()
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+            return
+
     username = input("Enter your Cognito username: ")
     password = getpass.getpass("Enter your Cognito password: ")
 
-    # Create Cognito client
-    client = boto3.client('cognito-idp', region_name=region)
-
     try:
         response = client.initiate_auth(
             ClientId=client_id,
@@ -26,6 +85,14 @@ def get_bearer_token():
         print("\n✅ Authentication successful.")
         print(f"Bearer Token (AccessToken):\n{token}")
 
+        refresh_token = response['AuthenticationResult'].get('RefreshToken')
+        if refresh_token:
+            try:
+                _save_refresh_token(client_id, refresh_token)
+            except OSError as e:
+                # The login already succeeded; only the next run's shortcut is lost
+                print(f"⚠️ Could not cache the refresh token: {e}")
+
     except client.exceptions.NotAuthorizedException:
         print("❌ Authentication failed: Invalid username or password.")
     except client.exceptions.UserNotConfirmedException:
@@ -38,6 +38,7 @@ Usage (with pop/corrections)
 Optional: inject long‑term memories for a query
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Build extra input items containing top‑k retrieved facts for the question
+    # (inside async code, use `await session.abuild_long_term_context(...)`)
     extra_context_items = session.build_long_term_context(
         namespace="support/facts/{sessionId}",
         query="What did we decide about pagination?",
@@ -50,6 +51,12 @@ Optional: inject long‑term memories for a query
         session=session,
     )
 
+    # In async code, fetch history and long‑term memories for a turn in one go
+    turn_items = await session.prepare_turn(
+        query="What did we decide about pagination?",
+        namespace="support/facts/{sessionId}",
+    )
+
 Notes
 ~~~~~
 - `clear_session()` clears *this Session's* view of history by ignoring prior
@@ -57,14 +64,26 @@ Notes
 - `pop_item()` is implemented as a *branch-on-next-add* optimization: we mark
   the previous event as the fork root and continue on a fresh branch on your
   next `add_items()` call. No upstream deletion is performed.
-- Each message is stored as its own Event to allow granular pop semantics.
+- Each `add_items()` call is stored as a single Event holding all of its
+  messages (the first write on a branch stores its first message separately,
+  so every multi-message Event has a previous Event). Popping one message out
+  of a multi-message Event forks from the previous Event and re-writes the
+  remaining messages on the next add.
 
 """
 
 import asyncio
 import datetime as dt
+import functools
+import os
+import threading
+import time
 import uuid
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from agents.items import TResponseInputItem
 from agents.memory.session import SessionABC
@@ -77,19 +96,202 @@ except Exception as e:  # pragma: no cover - import-time error is clearer to the
         "bedrock-agentcore-starter-toolkit is required: `pip install bedrock-agentcore-starter-toolkit`"
     ) from e
 
+try:
+    # Optional: native asyncio client for the AgentCore data plane
+    import aioboto3
+except ImportError:  # pragma: no cover - falls back to MemoryClient on a worker thread
+    aioboto3 = None
+
 
 ResponseItem = Dict[str, Any]
 
 
-def _content_part_for_role(text: str, role: str) -> Dict[str, str]:
-    """Return the correct Responses content part based on role.
-    - user/developer/system → input_text
-    - assistant/tool/other → output_text
+class AgentCoreEvent(NamedTuple):
+    """An AgentCore Event reduced to what the Session renders.
+
+    `messages` holds the non-empty (text, AgentCoreRole) conversational
+    messages of the event, in order.
     """
-    r = (role or "").lower()
-    if r in ("user", "system", "developer"):
-        return {"type": "input_text", "text": text}
-    return {"type": "output_text", "text": text}
+
+    event_id: str
+    messages: Tuple[Tuple[str, str], ...]
+
+
+# Clients shared by every AgentCoreSession in the process, keyed by (class, region).
+# A MemoryClient owns boto3 clients (botocore session, credential resolver,
+# connection pool); an AsyncMemoryClient owns an aioboto3 Session and one pooled
+# data-plane client per event loop. Sharing them spares each conversation that
+# setup and its TLS handshakes. boto3 clients are thread-safe, and aiobotocore
+# clients are safe to share between tasks of the loop they belong to.
+_CLIENT_CACHE: Dict[Tuple[type, Optional[str]], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _shared_client(cls: type, region: Optional[str]) -> Any:
+    """Return the process-wide `cls(region_name=region)`, creating it on first use."""
+    key = (cls, region)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = cls(region_name=region)
+        return client
+
+
+# Content part types that carry message text, and the one that marks assistant output
+_TEXT_TYPES = frozenset({"output_text", "input_text", "text"})
+_OUTPUT_TYPE = "output_text"
+
+# Responses content part type by (lowercase) role:
+# user/developer/system → input_text, assistant/tool/other → output_text
+_PART_TYPE_BY_ROLE: Dict[str, str] = {
+    "user": "input_text",
+    "system": "input_text",
+    "developer": "input_text",
+    "assistant": "output_text",
+    "tool": "output_text",
+}
+
+# AgentCore role → Responses role; tool outputs (and anything unknown) become assistant-visible context
+_AC_TO_OPENAI: Dict[str, str] = {
+    "USER": "user",
+    "ASSISTANT": "assistant",
+    "TOOL": "assistant",
+}
+
+
+class AsyncMemoryClient:
+    """Minimal asyncio counterpart of `MemoryClient` built on aioboto3.
+
+    Exposes the subset of `MemoryClient` used by `AgentCoreSession`
+    (`list_events`, `create_event`, `retrieve_memories`) with the same
+    arguments and return shapes, but awaits the AgentCore data plane directly
+    instead of blocking a worker thread for the whole round-trip.
+
+    One data-plane client (and its keep-alive connection pool) is kept per
+    running event loop, since aiobotocore clients are bound to the loop they
+    were opened on. Clients of loops that have since closed are dropped on the
+    next call; `aclose()` closes the current loop's client explicitly.
+    """
+
+    def __init__(self, region_name: Optional[str] = None) -> None:
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for AsyncMemoryClient: `pip install aioboto3`")
+        self.region_name = region_name
+        self._session = aioboto3.Session()
+        # event loop → task opening its client, resolving to (exit stack owning it, client)
+        self._clients: Dict[asyncio.AbstractEventLoop, "asyncio.Task[Tuple[AsyncExitStack, Any]]"] = {}
+
+    async def _data_plane(self) -> Any:
+        loop = asyncio.get_running_loop()
+        opening = self._clients.get(loop)
+        if opening is None:
+            # Concurrent first calls on a loop all wait for this one client
+            opening = self._clients[loop] = loop.create_task(self._open_data_plane())
+        try:
+            _, client = await asyncio.shield(opening)
+        except Exception:
+            if self._clients.get(loop) is opening:
+                del self._clients[loop]  # let the next call try again
+            raise
+        return client
+
+    async def _open_data_plane(self) -> Tuple[AsyncExitStack, Any]:
+        # Forget clients of loops that have finished (e.g. earlier asyncio.run()
+        # calls); their connections can't be reused
+        for old in [l for l in self._clients if l.is_closed()]:
+            await self._close_entry(self._clients.pop(old))
+
+        stack = AsyncExitStack()
+        client = await stack.enter_async_context(
+            self._session.client("bedrock-agentcore", region_name=self.region_name)
+        )
+        return stack, client
+
+    @staticmethod
+    async def _close_entry(opening: "asyncio.Task[Tuple[AsyncExitStack, Any]]") -> None:
+        if not opening.done() or opening.cancelled() or opening.exception() is not None:
+            return
+        try:
+            await opening.result()[0].aclose()
+        except Exception:
+            pass  # best-effort: the owning loop may already be gone
+
+    async def aclose(self) -> None:
+        """Close the data-plane client of the running event loop, if one is open."""
+        opening = self._clients.pop(asyncio.get_running_loop(), None)
+        if opening is not None:
+            await asyncio.wait([opening])
+            await self._close_entry(opening)
+
+    async def list_events(
+        self,
+        memory_id: str,
+        actor_id: str,
+        session_id: str,
+        max_results: int = 100,
+        include_payload: bool = True,
+        branch_name: Optional[str] = None,
+        include_parent_events: bool = False,
+    ) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        next_token: Optional[str] = None
+        client = await self._data_plane()
+        while len(events) < max_results:
+            params: Dict[str, Any] = {
+                "memoryId": memory_id,
+                "actorId": actor_id,
+                "sessionId": session_id,
+                "maxResults": min(100, max_results - len(events)),
+                "includePayloads": include_payload,
+            }
+            if next_token:
+                params["nextToken"] = next_token
+            if branch_name and branch_name != "main":
+                params["filter"] = {
+                    "branch": {"name": branch_name, "includeParentBranches": include_parent_events}
+                }
+            response = await client.list_events(**params)
+            events.extend(response.get("events", []))
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+        return events[:max_results]
+
+    async def create_event(
+        self,
+        memory_id: str,
+        actor_id: str,
+        session_id: str,
+        messages: List[Tuple[str, str]],
+        event_timestamp: Optional[dt.datetime] = None,
+        branch: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            "memoryId": memory_id,
+            "actorId": actor_id,
+            "sessionId": session_id,
+            "eventTimestamp": event_timestamp or dt.datetime.now(dt.timezone.utc),
+            "payload": [
+                {"conversational": {"content": {"text": text}, "role": role.upper()}}
+                for text, role in messages
+            ],
+        }
+        if branch:
+            params["branch"] = branch
+        client = await self._data_plane()
+        response = await client.create_event(**params)
+        return response["event"]
+
+    async def retrieve_memories(
+        self, memory_id: str, namespace: str, query: str, top_k: int = 3
+    ) -> List[Dict[str, Any]]:
+        client = await self._data_plane()
+        response = await client.retrieve_memory_records(
+            memoryId=memory_id,
+            namespace=namespace,
+            searchCriteria={"searchQuery": query, "topK": top_k},
+        )
+        return response.get("memoryRecordSummaries", [])
 
 
 class AgentCoreSession(SessionABC):
@@ -110,9 +312,33 @@ class AgentCoreSession(SessionABC):
         Optional explicit branch name to continue on. When `pop_item()` is used,
         a new branch will be created automatically (name prefixed with "fix-").
     client : MemoryClient | None
-        Optionally pass an already-configured MemoryClient.
+        Optionally pass an already-configured MemoryClient. Its blocking calls
+        are run on a worker thread. When omitted, a client shared by all
+        sessions for the same region is used.
+    use_async_client : bool
+        When no `client` is given and aioboto3 is installed (default), talk to
+        AgentCore through `AsyncMemoryClient` instead of a worker thread.
+    cache_ttl : float
+        Seconds a `list_events` result is reused by `get_items()`/`pop_item()`
+        (and a `retrieve_memories` result by `abuild_long_term_context()`)
+        before re-fetching (default 30), and how long `pop_item()` trusts the
+        last events it saw. Writes through this Session invalidate the cache
+        immediately; the TTL only bounds staleness from other writers.
+        Set to 0 to disable caching.
+    max_entries : int
+        Maximum number of cached results per cache (default 8).
+
+    Blocking `MemoryClient` calls run on a thread pool shared by all sessions
+    and created by the first one that needs it. Size it with
+    `AgentCoreSession.configure_io_pool()` (default `$AGENTCORE_THREAD_POOL_SIZE`
+    or 16) and release it with `AgentCoreSession.shutdown_io_pool()`.
     """
 
+    # Dedicated pool for blocking MemoryClient calls (instead of asyncio's default executor)
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    _io_workers: int = int(os.getenv("AGENTCORE_THREAD_POOL_SIZE", "16"))
+
     # ------------- Construction -------------
     def __init__(
         self,
@@ -122,17 +348,40 @@ class AgentCoreSession(SessionABC):
         region: Optional[str] = None,
         branch_name: Optional[str] = None,
         client: Optional[MemoryClient] = None,
+        use_async_client: bool = True,
+        cache_ttl: float = 30.0,
+        max_entries: int = 8,
     ) -> None:
         self.memory_id = memory_id
         self.session_id = session_id
         self.actor_id = actor_id
-        self._client = client or MemoryClient(region_name=region)
+        self._client = client or _shared_client(MemoryClient, region)
+        self._aclient: Optional[AsyncMemoryClient] = (
+            _shared_client(AsyncMemoryClient, region)
+            if client is None and use_async_client and aioboto3 is not None
+            else None
+        )
 
         # View/state controls for pop/clear/branching
         self._current_branch: Optional[str] = branch_name
         self._pop_fork_root_event_id: Optional[str] = None  # set when pop_item() called
+        self._pop_fork_root_index: Optional[int] = None  # its position in the branch listing, if known
+        # Messages of the popped Event that were *not* popped; re-written on the next add
+        self._pop_carry: List[Tuple[str, str]] = []
         self._cleared: bool = False  # when True, get_items() returns [] until new adds
 
+        # list_events results keyed by (memory, actor, session, branch, max_results) → (fetched_at, events)
+        self._cache_ttl = cache_ttl
+        self._cache_max_entries = max_entries
+        self._events_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, List[AgentCoreEvent]]]" = OrderedDict()
+        # retrieve_memories results keyed by (memory, namespace, query, top_k) → (fetched_at, items)
+        self._ltm_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, List[TResponseInputItem]]]" = OrderedDict()
+
+        # Last ≤2 events of the current branch as last seen via list/create; None when unknown.
+        # _tail_at is when the listing it came from was fetched (time.monotonic())
+        self._tail: Optional[List[AgentCoreEvent]] = None
+        self._tail_at: float = 0.0
+
     # ------------- SessionABC methods -------------
     async def get_items(self, limit: int | None = None) -> List[TResponseInputItem]:
         """Return conversation history as OpenAI Responses items.
@@ -143,124 +392,129 @@ class AgentCoreSession(SessionABC):
         if self._cleared:
             return []
 
-        events = await asyncio.to_thread(
-            self._client.list_events,
-            memory_id=self.memory_id,
-            actor_id=self.actor_id,
-            session_id=self.session_id,
-            branch_name=self._current_branch or None,
-            include_parent_events=False,
-            max_results=limit or 100,
-            include_payload=True,
-        )
+        events = await self._list_events_cached(max_results=limit or 100)
 
-        # If a pop was requested, hide events after the fork root
-        if self._pop_fork_root_event_id:
-            try:
-                idx = next(i for i, e in enumerate(events) if e["eventId"] == self._pop_fork_root_event_id)
-                events = events[: idx + 1]  # keep up to the fork root
-            except StopIteration:
-                # If we can't find the root, fall back to returning everything up to last-1
-                events = events[:-1] if events else []
+        events = self._apply_pop_view(events)
 
-        items: List[TResponseInputItem] = []
-        for ev in events:
-            for p in ev.get("payload", []):
-                conv = p.get("conversational")
-                if not conv:
-                    continue
-                role = self._map_agentcore_role_to_openai(conv.get("role"))
-                text = (conv.get("content") or {}).get("text") or ""
-                if text == "":
-                    continue
-                # Responses API-friendly input item
-                items.append({"role": role, "content": [_content_part_for_role(text, role)]})
+        if limit is None:
+            messages = [m for ev in events for m in ev.messages]
+            # Messages left over from a partially popped event
+            messages.extend(self._pop_carry)
+        else:
+            # Walk newest → oldest and stop as soon as `limit` messages are collected
+            def newest_first() -> Iterable[Tuple[str, str]]:
+                yield from reversed(self._pop_carry)
+                for ev in reversed(events):
+                    yield from reversed(ev.messages)
 
-        if limit is not None:
-            items = items[-limit:]
-        return items
+            messages = list(islice(newest_first(), limit))
+            messages.reverse()
+
+        # Responses API-friendly input items
+        return [self._to_response_item(text, ac_role) for text, ac_role in messages]
 
     async def add_items(self, items: List[TResponseInputItem]) -> None:
         """Persist new items into AgentCore Memory.
 
-        To support `pop_item()` granularity, we write **one Event per item**.
-        If a pop was requested earlier, the first new event will transparently
-        *fork* the conversation from the selected root, creating a fresh branch.
+        All messages of one call are written as a **single Event** (one RPC),
+        except when the event may be the first on its branch: then the first
+        message gets an Event of its own so the rest always have an earlier
+        Event to fork from (see `pop_item()`). If a pop was requested earlier,
+        the write transparently *forks* the conversation from the selected
+        root, creating a fresh branch, and also carries the messages of the
+        popped event that were not popped.
         """
-        if not items:
+        # Skip empty items; with nothing to write, leave the pop/clear state untouched
+        messages = [(t, r) for item in items for t, r in (self._extract_text_and_role(item),) if t]
+        if not messages:
             return
 
         # Determine if we need to create/continue a branch due to a prior pop()
-        branch_for_first: Optional[Dict[str, str]] = None
-        if self._pop_fork_root_event_id:
+        branch: Optional[Dict[str, str]] = None
+        forked = bool(self._pop_fork_root_event_id)
+        if forked:
             self._current_branch = self._current_branch or self._gen_branch_name("fix")
-            branch_for_first = {"rootEventId": self._pop_fork_root_event_id, "name": self._current_branch}
+            branch = {"rootEventId": self._pop_fork_root_event_id, "name": self._current_branch}
+            messages = self._pop_carry + messages
             self._pop_fork_root_event_id = None
+            self._pop_fork_root_index = None
+            self._pop_carry = []
             self._cleared = False
+        elif self._current_branch:
+            # Continuing an existing branch only needs its name
+            branch = {"name": self._current_branch}
+
+        # A multi-message event with no event before it could not be partially
+        # popped, so unless the branch is known to be non-empty, split off the first message
+        if len(messages) > 1 and (forked or not self._tail):
+            batches = [messages[:1], messages[1:]]
+        else:
+            batches = [messages]
 
-        # For subsequent events in the same add, we only need the branch name
-        branch_for_rest: Optional[Dict[str, str]] = (
-            ({"name": self._current_branch} if self._current_branch else None)
-        )
-
-        # Write each item as its own event
-        for idx, item in enumerate(items):
-            text, role = self._extract_text_and_role(item)
-            if not text:
-                continue  # skip empty items
-
-            branch = branch_for_first if idx == 0 and branch_for_first else branch_for_rest
-
-            await asyncio.to_thread(
-                self._client.create_event,
+        written: List[AgentCoreEvent] = []
+        for batch in batches:
+            event = await self._create_event(
                 memory_id=self.memory_id,
                 actor_id=self.actor_id,
                 session_id=self.session_id,
-                messages=[(text, role)],
-                event_timestamp=dt.datetime.utcnow(),
+                messages=batch,
+                event_timestamp=dt.datetime.now(dt.timezone.utc),
                 branch=branch,
             )
+            written.append(AgentCoreEvent(event["eventId"], tuple(batch)))
+            if branch:
+                # Only the first event of a fork carries the root
+                branch = {"name": branch["name"]}
+        self._events_cache.clear()
+        # A fresh fork starts a new branch listing; re-learn its tail on the next read
+        if forked or self._tail is None:
+            self._tail = None
+        else:
+            # _tail_at stays at the listing time: other writers may have appended since
+            self._tail = (self._tail + written)[-2:]
 
     async def pop_item(self) -> TResponseInputItem | None:
         """Remove and return the most recent item from this session (view).
 
         Implementation detail:
         - AgentCore doesn't support deleting an individual message within an event.
-        - We store each message as a separate Event.
-        - `pop_item()` sets an internal *fork root* to the previous Event. On the
-          next `add_items()` call, we branch from that Event, effectively
-          discarding the last Event from this Session's viewpoint.
+        - An Event may hold several messages (one per `add_items()` call).
+        - `pop_item()` sets an internal *fork root* to the previous Event and keeps
+          the last Event's other messages aside. On the next `add_items()` call, we
+          branch from that Event and re-write those messages, effectively
+          discarding only the popped message from this Session's viewpoint.
         """
-        events = await asyncio.to_thread(
-            self._client.list_events,
-            memory_id=self.memory_id,
-            actor_id=self.actor_id,
-            session_id=self.session_id,
-            branch_name=self._current_branch or None,
-            include_parent_events=False,
-            max_results=100,
-            include_payload=True,
-        )
+        # Messages kept aside by an earlier pop are the newest ones in the view
+        if self._pop_carry:
+            return self._to_response_item(*self._pop_carry.pop())
+
+        tail_fresh = time.monotonic() - self._tail_at < self._cache_ttl
+        if self._tail is not None and tail_fresh and not self._pop_fork_root_event_id:
+            # The last two events are known and recent; no round-trip needed
+            events = self._tail
+            listed = False
+        else:
+            listed = True
+            # Same max_results as get_items() so a fresh listing is served from the cache
+            events = await self._list_events_cached(max_results=100)
+            events = self._apply_pop_view(events)
         if not events:
             return None
 
         last = events[-1]
         prev = events[-2] if len(events) > 1 else None
 
-        # Build return item from the last event's final conversational payload
-        last_item: Optional[TResponseInputItem] = None
-        for p in reversed(last.get("payload", [])):
-            conv = p.get("conversational")
-            if not conv:
-                continue
-            role = self._map_agentcore_role_to_openai(conv.get("role"))
-            text = (conv.get("content") or {}).get("text") or ""
-            if text:
-                last_item = {"role": role, "content": [_content_part_for_role(text, role)]}
-                break
-
-        # Mark the fork root so the *next add* continues from `prev`
-        self._pop_fork_root_event_id = prev["eventId"] if prev else None
+        # Build return item from the last event's final conversational message
+        messages = last.messages
+        last_item = self._to_response_item(*messages[-1]) if messages else None
+
+        # Mark the fork root so the *next add* continues from `prev`, re-writing
+        # the messages of `last` that were not popped
+        self._pop_fork_root_event_id = prev.event_id if prev else None
+        # The pop view is a prefix of the listing, so prev's index carries over;
+        # a tail-only pop leaves it for _apply_pop_view() to find once
+        self._pop_fork_root_index = len(events) - 2 if prev and listed else None
+        self._pop_carry = list(messages[:-1]) if prev else []
         return last_item
 
     async def clear_session(self) -> None:
@@ -271,41 +525,223 @@ class AgentCoreSession(SessionABC):
         data, delete/recreate the Memory resource or rotate `session_id`.
         """
         self._cleared = True
+        self._events_cache.clear()
         # We purposely do not change branches here; next add will resume on the
         # current branch (or main). If you need a hard reset, change session_id.
 
+    @classmethod
+    def configure_io_pool(cls, max_workers: int) -> None:
+        """Set the size of the thread pool used for blocking `MemoryClient` calls.
+
+        Applies to every session of this class. A pool that is already running
+        is shut down and recreated at the new size on its next use.
+        """
+        with cls._executor_lock:
+            cls._io_workers = max_workers
+        cls.shutdown_io_pool()
+
+    @classmethod
+    def shutdown_io_pool(cls) -> None:
+        """Shut down the thread pool used for blocking `MemoryClient` calls.
+
+        The pool is shared by every session of this class, so call this once at
+        process shutdown, not when a single conversation ends. It is recreated
+        on demand if any session needs it again.
+        """
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False)
+                cls._executor = None
+
     # ------------- Optional helpers -------------
-    def build_long_term_context(self, namespace: str, query: str, top_k: int = 3) -> List[TResponseInputItem]:
+    async def abuild_long_term_context(
+        self, namespace: str, query: str, top_k: int = 3
+    ) -> List[TResponseInputItem]:
         """Retrieve top‑k long‑term memories and return them as a single system item.
 
         This lets you prepend semantic memories to your inputs when desired.
+        The retrieval runs off the event loop, and results are reused for
+        `cache_ttl` seconds per (namespace, query, top_k).
         """
-        if "{sessionId}" in namespace:
-            ns = namespace.replace("{sessionId}", self.session_id)
+        ns = namespace.replace("{sessionId}", self.session_id)
+        key = (self.memory_id, ns, query, top_k)
+        cached = self._cache_lookup(self._ltm_cache, key)
+        if cached is not None:
+            return cached
+
+        if self._aclient is not None:
+            memories = await self._aclient.retrieve_memories(
+                memory_id=self.memory_id, namespace=ns, query=query, top_k=top_k
+            )
+        else:
+            memories = await self._run_blocking(
+                self._client.retrieve_memories, memory_id=self.memory_id, namespace=ns, query=query, top_k=top_k
+            )
+        items = self._format_long_term_context(memories or [])
+        self._cache_store(self._ltm_cache, key, items)
+        return items
+
+    async def prepare_turn(
+        self, *, query: str, namespace: str, top_k: int = 3, limit: int | None = None
+    ) -> List[TResponseInputItem]:
+        """Return long‑term context followed by the conversation history for a new turn.
+
+        Fetches history (`get_items`) and long‑term memories
+        (`abuild_long_term_context`) concurrently, so prefer this over awaiting
+        the two calls one after the other.
+        """
+        items, extras = await asyncio.gather(
+            self.get_items(limit=limit),
+            self.abuild_long_term_context(namespace, query, top_k),
+        )
+        return [*extras, *items]
+
+    def build_long_term_context(self, namespace: str, query: str, top_k: int = 3) -> List[TResponseInputItem]:
+        """Synchronous `abuild_long_term_context` for scripts without an event loop.
+
+        Raises RuntimeError when called from a running event loop, where the
+        blocking retrieval would stall every other task; await
+        `abuild_long_term_context()` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
         else:
-            ns = namespace
+            raise RuntimeError("build_long_term_context() blocks the event loop; await abuild_long_term_context()")
 
+        ns = namespace.replace("{sessionId}", self.session_id)
         memories: List[Dict[str, Any]] = self._client.retrieve_memories(
             memory_id=self.memory_id, namespace=ns, query=query, top_k=top_k
         ) or []
+        return self._format_long_term_context(memories)
 
-        if not memories:
-            return []
-
+    @staticmethod
+    def _format_long_term_context(memories: List[Dict[str, Any]]) -> List[TResponseInputItem]:
         # Compact the memories into a short system item (you can customize this)
-        lines = []
-        for m in memories:
-            content = (m.get("content") or {}).get("text")
-            if content:
-                lines.append(f"• {content}")
-        text = "Relevant facts from long‑term memory:\n" + "\n".join(lines)
+        body = "\n".join(f"• {t}" for m in memories if (t := (m.get("content") or {}).get("text")))
+        if not body:
+            return []
+        text = "Relevant facts from long‑term memory:\n" + body
         # Use developer role to supply instructions-like context that won't be mistaken for a prior assistant output
         return [{"role": "developer", "content": [{"type": "input_text", "text": text}]}]
 
     # ------------- Internal utilities -------------
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls._io_workers, thread_name_prefix="agentcore-io"
+                )
+            return cls._executor
+
+    async def _run_blocking(self, fn: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(fn, **kwargs))
+
+    async def _list_events(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        if self._aclient is not None:
+            return await self._aclient.list_events(**kwargs)
+        return await self._run_blocking(self._client.list_events, **kwargs)
+
+    async def _list_events_cached(self, max_results: int) -> List[AgentCoreEvent]:
+        """Normalized `list_events` for the current branch, served from the cache while fresh.
+
+        The returned list is shared with the cache and must not be mutated.
+        """
+        key = (self.memory_id, self.actor_id, self.session_id, self._current_branch, max_results)
+        cached = self._cache_lookup(self._events_cache, key)
+        if cached is not None:
+            self._remember_tail(cached, max_results, self._events_cache[key][0])
+            return cached
+
+        fetched_at = time.monotonic()
+        raw = await self._list_events(
+            memory_id=self.memory_id,
+            actor_id=self.actor_id,
+            session_id=self.session_id,
+            branch_name=self._current_branch or None,
+            max_results=max_results,
+            include_payload=True,
+        )
+        events = self._normalize(raw)
+        self._cache_store(self._events_cache, key, events)
+        self._remember_tail(events, max_results, fetched_at)
+        return events
+
+    def _remember_tail(self, events: List[AgentCoreEvent], max_results: int, fetched_at: float) -> None:
+        # Only a listing that reaches the end of the branch shows its tail; a
+        # get_items(limit=N) listing is capped at N events and may stop short
+        if max_results == 100 or len(events) < max_results:
+            self._tail = events[-2:]
+            self._tail_at = fetched_at
+
+    def _cache_lookup(self, cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]", key: Tuple[Any, ...]) -> Any:
+        """Return the cached value for `key` if younger than `cache_ttl`, else None."""
+        hit = cache.get(key)
+        if hit is None or time.monotonic() - hit[0] >= self._cache_ttl:
+            return None
+        cache.move_to_end(key)
+        return hit[1]
+
+    def _cache_store(self, cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]", key: Tuple[Any, ...], value: Any) -> None:
+        if self._cache_ttl <= 0:
+            return
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > self._cache_max_entries:
+            cache.popitem(last=False)
+
+    async def _create_event(self, **kwargs: Any) -> Dict[str, Any]:
+        if self._aclient is not None:
+            return await self._aclient.create_event(**kwargs)
+        return await self._run_blocking(self._client.create_event, **kwargs)
+
+    def _apply_pop_view(self, events: List[AgentCoreEvent]) -> List[AgentCoreEvent]:
+        """Hide events after the fork root set by `pop_item()`."""
+        root_id = self._pop_fork_root_event_id
+        if not root_id:
+            return events
+        idx = self._pop_fork_root_index
+        if idx is not None and idx < len(events) and events[idx].event_id == root_id:
+            return events[: idx + 1]  # keep up to the fork root
+        try:
+            idx = next(i for i, e in enumerate(events) if e.event_id == root_id)
+            self._pop_fork_root_index = idx
+            return events[: idx + 1]
+        except StopIteration:
+            # If we can't find the root, fall back to returning everything up to last-1
+            return events[:-1] if events else []
+
+    @staticmethod
+    def _normalize(events: List[Dict[str, Any]]) -> List[AgentCoreEvent]:
+        """Walk each raw event's conversational payload once and keep only what is rendered."""
+        normalized: List[AgentCoreEvent] = []
+        for ev in events:
+            messages: List[Tuple[str, str]] = []
+            for p in ev.get("payload", []):
+                conv = p.get("conversational")
+                if not conv:
+                    continue
+                text = (conv.get("content") or {}).get("text") or ""
+                if text:
+                    messages.append((text, conv.get("role") or "ASSISTANT"))
+            normalized.append(AgentCoreEvent(ev["eventId"], tuple(messages)))
+        return normalized
+
+    @classmethod
+    def _to_response_item(cls, text: str, ac_role: str) -> TResponseInputItem:
+        role = cls._map_agentcore_role_to_openai(ac_role)
+        return {"role": role, "content": [{"type": _PART_TYPE_BY_ROLE.get(role, "output_text"), "text": text}]}
+
     @staticmethod
     def _gen_branch_name(prefix: str) -> str:
-        return f"{prefix}-{dt.datetime.utcnow().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        t = time.gmtime()
+        return (
+            f"{prefix}-{t.tm_year}{t.tm_mon:02d}{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}-{uuid.uuid4().hex[:6]}"
+        )
 
     @staticmethod
     def _extract_text_and_role(item: TResponseInputItem) -> Tuple[str, str]:
@@ -318,58 +754,39 @@ class AgentCoreSession(SessionABC):
             * else → assistant
         - Extract text from the first part with type in {'output_text','input_text','text'}.
         """
-        # --- Role
-        role_raw: Optional[str] = None
-        if isinstance(item, dict):
-            role_raw = item.get("role")  # may be None
-        role_lower = (role_raw or "").lower()
-
-        # Content parts for role inference
-        content = item.get("content") if isinstance(item, dict) else None
-        parts = content if isinstance(content, list) else ([] if content is None else [content])
-        inferred_role = None
+        if not isinstance(item, dict):
+            return str(item), "ASSISTANT"
+
+        role_raw: Optional[str] = item.get("role")  # may be None
+        content = item.get("content")
+
+        # Single pass over the content parts: infer the role and pick the text
+        text = content if isinstance(content, str) else ""
+        has_parts = isinstance(content, list)  # text is only taken from a list of parts
+        parts = content if has_parts else ([] if content is None else [content])
+        need_role = not role_raw
+        inferred_role: Optional[str] = None
         for part in parts:
-            if isinstance(part, dict) and part.get("type") == "output_text":
+            if not isinstance(part, dict):
+                continue
+            part_type = part.get("type")
+            if part_type == _OUTPUT_TYPE:
                 inferred_role = "assistant"
+            elif part_type == "input_text" and inferred_role is None:
+                inferred_role = "user"
+            if has_parts and not text and part_type in _TEXT_TYPES:
+                t = part.get("text")
+                if isinstance(t, str) and t:
+                    text = t
+            if text and (not need_role or inferred_role == "assistant"):
                 break
-            if isinstance(part, dict) and part.get("type") == "input_text":
-                inferred_role = inferred_role or "user"
-        final_role = role_lower or (inferred_role or "assistant")
-
-        # Map to AgentCore role
-        if final_role == "user":
-            ac_role = "USER"
-        elif final_role == "assistant":
-            ac_role = "ASSISTANT"
-        else:
-            # developer/system/tool/other → store as assistant context
-            ac_role = "ASSISTANT"
-
-        # --- Text
-        text = ""
-        if isinstance(item, dict):
-            if isinstance(content, str):
-                text = content
-            elif isinstance(content, list):
-                for part in content:
-                    if isinstance(part, dict) and part.get("type") in {"output_text", "input_text", "text"}:
-                        t = part.get("text")
-                        if isinstance(t, str) and t:
-                            text = t
-                            break
-        else:
-            text = str(item)
+        final_role = (role_raw or "").lower() or (inferred_role or "assistant")
+
+        # Map to AgentCore role; developer/system/tool/other → store as assistant context
+        ac_role = "USER" if final_role == "user" else "ASSISTANT"
 
         return text, ac_role
 
     @staticmethod
     def _map_agentcore_role_to_openai(ac_role: Optional[str]) -> str:
-        r = (ac_role or "").upper()
-        if r == "USER":
-            return "user"
-        if r == "ASSISTANT":
-            return "assistant"
-        if r == "TOOL":
-            # Represent tool outputs as assistant-visible context
-            return "assistant"
-        return "assistant"
+        return _AC_TO_OPENAI.get((ac_role or "").upper(), "assistant")
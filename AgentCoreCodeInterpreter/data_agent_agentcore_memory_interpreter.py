@@ -3,13 +3,17 @@
 
 # Data Agent — Agents SDK + Vector Stores + WebSearch + Guardrails + AgentCore Code Interpreter
 
-import os, re, json
+import os, json, asyncio, time, atexit, threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Union
 import ast
 import operator as _op
+from types import CodeType
 
-from openai import OpenAI
+import orjson
+from botocore.exceptions import ClientError
+from openai import NotFoundError, OpenAI
 from agents import set_default_openai_key, Agent, Runner, function_tool, ModelSettings, RunConfig
 from agents.tool import WebSearchTool, FileSearchTool
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
@@ -30,16 +34,43 @@ if not api_key:
 client = OpenAI(api_key=api_key)
 set_default_openai_key(api_key)
 
+# Resolved vector store ids are persisted to /tmp (writable on Lambda/AgentCore)
+# so cold starts don't page through every store; a cached id is checked with one
+# retrieve() in case the store was deleted. Set VECTOR_STORE_ID to skip the lookup.
+VS_ID_CACHE_PATH = Path(os.getenv("VECTOR_STORE_ID_CACHE", "/tmp/data_agent_vs_id.json"))
+VS_ID_CACHE_TTL = int(os.getenv("VECTOR_STORE_ID_CACHE_TTL", "86400"))  # seconds
+
+def _read_vs_id_cache() -> dict:
+    try:
+        if time.time() - VS_ID_CACHE_PATH.stat().st_mtime > VS_ID_CACHE_TTL:
+            return {}
+        return json.loads(VS_ID_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+@lru_cache(maxsize=None)
 def get_vector_store_id_by_name(name: str) -> str:
-    cursor = None
-    while True:
-        page = client.vector_stores.list(limit=50, after=cursor) if cursor else client.vector_stores.list(limit=50)
-        for vs in page.data:
-            if vs.name == name:
-                return vs.id
-        if not page.has_more:
-            break
-        cursor = page.last_id
+    env_id = os.getenv("VECTOR_STORE_ID")
+    if env_id:
+        return env_id
+
+    cached = _read_vs_id_cache()
+    if name in cached:
+        try:
+            client.vector_stores.retrieve(cached[name])
+            return cached[name]
+        except NotFoundError:
+            del cached[name]  # store was deleted (e.g. replaced by a recreated one); look it up again
+
+    # The SDK's page iterator follows has_more/after for us
+    for vs in client.vector_stores.list(limit=100):
+        if vs.name == name:
+            cached[name] = vs.id
+            try:
+                VS_ID_CACHE_PATH.write_text(json.dumps(cached))
+            except OSError:
+                pass  # cache is best-effort
+            return vs.id
     raise RuntimeError(f"Vector store named '{name}' not found")
 
 # -----------------------------
@@ -55,24 +86,27 @@ _ALLOWED_OPS = {
     ast.Mod: _op.mod,
 }
 
-def _eval_ast(node: ast.AST) -> Any:
-    if isinstance(node, ast.Constant):        # type: ignore[attr-defined]
-        return node.value
-    if isinstance(node, ast.UnaryOp) and type(node.op) in _ALLOWED_OPS:
-        return _ALLOWED_OPS[type(node.op)](_eval_ast(node.operand))
-    if isinstance(node, ast.BinOp) and type(node.op) in _ALLOWED_OPS:
-        return _ALLOWED_OPS[type(node.op)](_eval_ast(node.left), _eval_ast(node.right))
-    raise ValueError("Unsupported expression")
+# Characters allowed in an expression; _compile_expression remains the authoritative guard
+_ALLOWED_CHARS = frozenset("0123456789 \t\n()+-*/.^%")
+_ALLOWED_NODES = (ast.Expression, ast.Constant, ast.UnaryOp, ast.BinOp, *_ALLOWED_OPS)
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str) -> CodeType:
+    """Validate the AST against the allowlist, then compile it to bytecode (cached per expression)."""
+    tree = ast.parse(expr, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError("Unsupported expression")
+    return compile(tree, "<calc>", "eval")
 
 @function_tool
 def eval_expression(expression: str) -> str:
     """Safely evaluate an arithmetic expression using + - * / % ** and parentheses."""
     expr = expression.strip().replace("^", "**")
-    if not re.fullmatch(r"[\d\s\(\)\+\-\*/\.\^%]+", expr):
+    if not expr or not _ALLOWED_CHARS.issuperset(expr):
         return "Error: arithmetic only"
     try:
-        tree = ast.parse(expr, mode="eval")
-        return str(_eval_ast(tree.body))  # type: ignore[attr-defined]
+        return str(eval(_compile_expression(expr), {"__builtins__": {}}, {}))
     except Exception as e:
         return f"Error: {e}"
 
@@ -101,12 +135,15 @@ from agents import (
     input_guardrail,
 )
 
-session = AgentCoreSession(
-    session_id="user-1234-convo-abcdef",
-    memory_id="memory_wyyo7-UQXcX18hTU",
-    actor_id="app/user-1234",
-    region="eu-central-1"
-)
+@lru_cache(maxsize=1)
+def get_session() -> AgentCoreSession:
+    """Return the process-wide AgentCore session, created on first use."""
+    return AgentCoreSession(
+        session_id="user-1234-convo-abcdef",
+        memory_id="memory_wyyo7-UQXcX18hTU",
+        actor_id="app/user-1234",
+        region="eu-central-1"
+    )
 
 class YarGuardOutput(BaseModel):
     is_blocked: bool
@@ -131,18 +168,64 @@ async def tasha_guardrail(ctx: RunContextWrapper[None], agent: Agent, input: Uni
         tripwire_triggered=bool(result.final_output.is_blocked),
     )
 
-# -----------------------------
-# Hosted tools: search + files
-# -----------------------------
-web_search = WebSearchTool()
-vs_id = get_vector_store_id_by_name(name="Data Lines Vector Store")
-file_search = FileSearchTool(vector_store_ids=[vs_id], max_num_results=3)
-
 # ------------------------------------------------------
 # NEW: AgentCore Code Interpreter tool (execute_python)
 # ------------------------------------------------------
+# One long-lived Code Interpreter session per worker: starting a session costs
+# far more than running a snippet, so it is opened lazily and reused.
+_CI_LOCK = threading.Lock()
+_ci_session_cm = None
+_ci_client = None
+
+def _close_ci_session() -> None:
+    global _ci_session_cm, _ci_client
+    if _ci_session_cm is not None:
+        try:
+            _ci_session_cm.__exit__(None, None, None)
+        except Exception:
+            pass  # session may already have timed out upstream
+    _ci_session_cm = _ci_client = None
+
+atexit.register(_close_ci_session)
+
+def _get_ci_client():
+    global _ci_session_cm, _ci_client
+    if _ci_client is None:
+        # Use the same region as our AgentCore session
+        region = getattr(get_session(), "region", os.getenv("AWS_REGION", "us-east-1"))
+        _ci_session_cm = code_session(region)
+        _ci_client = _ci_session_cm.__enter__()
+    return _ci_client
+
+def _session_gone(exc: ClientError) -> bool:
+    # InvokeCodeInterpreter reports an expired/stopped session as ResourceNotFoundException
+    return exc.response.get("Error", {}).get("Code") == "ResourceNotFoundException"
+
+def _run_code(code: str, clear_context: bool) -> List[Any]:
+    """Run code in the shared Code Interpreter session and return every event["result"] in order."""
+    params = {
+        "code": code,
+        "language": "python",
+        "clearContext": bool(clear_context),
+    }
+    # The session is stateful, so calls are serialized. Only when the session
+    # expired upstream (the code never ran) start a fresh one and retry once;
+    # anything else may have run the code already, so it is re-raised.
+    with _CI_LOCK:
+        try:
+            response = _get_ci_client().invoke("executeCode", params)
+        except ClientError as e:
+            if not _session_gone(e):
+                raise
+            _close_ci_session()
+            response = _get_ci_client().invoke("executeCode", params)
+
+        # Each event has a "result" payload; keep all of them (stdout/stderr progress)
+        results = [event["result"] for event in response["stream"] if event.get("result")]
+    return results
+
 @function_tool
-def execute_python(code: str, description: str = "", clear_context: bool = False) -> str:
+async def execute_python(code: str, description: str = "", clear_context: bool = False) -> str:
     """
     Execute Python code in an AgentCore Code Interpreter session.
 
@@ -152,51 +235,50 @@ def execute_python(code: str, description: str = "", clear_context: bool = False
         clear_context: If True, resets the interpreter state before running.
 
     Returns:
-        A JSON string of the final event["result"] from the Code Interpreter stream,
-        including fields like sessionId, isError, content, structuredContent (stdout/stderr/exitCode).
+        A JSON string {"events": [...], "final": {...}}. "final" is the last event["result"]
+        from the Code Interpreter stream, including fields like sessionId, isError, content,
+        structuredContent (stdout/stderr/exitCode); "events" holds the earlier results in order.
     """
     # Build code with optional description banner
     if description:
         code = f"# {description}\n{code}"
 
-    # Use the same region as our AgentCore session
-    region = getattr(session, "region", os.getenv("AWS_REGION", "us-east-1"))
-
-    # Invoke the Code Interpreter and stream results
-    last_result = None
-    with code_session(region) as ci:
-        response = ci.invoke(
-            "executeCode",
-            {
-                "code": code,
-                "language": "python",
-                "clearContext": bool(clear_context),
-            },
-        )
-        for event in response["stream"]:
-            # Each event has a "result" payload; keep the latest
-            last_result = event.get("result")
-
-    return json.dumps(last_result or {"isError": True, "message": "No result from Code Interpreter"})
+    # Run the blocking client off the event loop so other tool calls in the turn can overlap it
+    results = await asyncio.to_thread(_run_code, code, clear_context)
+    if not results:
+        return orjson.dumps({"isError": True, "message": "No result from Code Interpreter"}).decode()
+
+    return orjson.dumps({"events": results[:-1], "final": results[-1]}, default=str).decode()
 
 # -----------------------------
 # Lt. Cmdr. Data (main agent)
 # -----------------------------
-data_agent = Agent(
-    name="Lt. Cmdr. Data",
-    instructions=(
-        f"{RECOMMENDED_PROMPT_PREFIX}\n"
-        "You are Lt. Commander Data from Star Trek: TNG. Be precise and concise (≤3 sentences).\n"
-        "• Use file_search for questions about Commander Data (RAG).\n"
-        "• Use web_search for current facts on the public web.\n"
-        "• If the user asks to run Python or verify with code, call the execute_python tool. "
-        "Return the result and (briefly) what was executed."
-    ),
-    tools=[web_search, file_search, execute_python],   # <-- added execute_python
-    input_guardrails=[tasha_guardrail],
-    handoffs=[calculator_agent],
-    model_settings=ModelSettings(temperature=0),
-)
+@lru_cache(maxsize=1)
+def build_data_agent() -> Agent:
+    """Build the Data agent on first use and reuse it for every later request.
+
+    The vector store lookup behind file_search only runs here, not at import.
+    """
+    # Hosted tools: search + files
+    web_search = WebSearchTool()
+    vs_id = get_vector_store_id_by_name(name="Data Lines Vector Store")
+    file_search = FileSearchTool(vector_store_ids=[vs_id], max_num_results=3)
+
+    return Agent(
+        name="Lt. Cmdr. Data",
+        instructions=(
+            f"{RECOMMENDED_PROMPT_PREFIX}\n"
+            "You are Lt. Commander Data from Star Trek: TNG. Be precise and concise (≤3 sentences).\n"
+            "• Use file_search for questions about Commander Data (RAG).\n"
+            "• Use web_search for current facts on the public web.\n"
+            "• If the user asks to run Python or verify with code, call the execute_python tool. "
+            "Return the result and (briefly) what was executed."
+        ),
+        tools=[web_search, file_search, execute_python],   # <-- added execute_python
+        input_guardrails=[tasha_guardrail],
+        handoffs=[calculator_agent],
+        model_settings=ModelSettings(temperature=0),
+    )
 
 # -----------------------------
 # Bedrock AgentCore app entry
@@ -208,7 +290,7 @@ async def invoke(payload):
     user_message = payload.get("prompt", "Data, reverse the main deflector array!")
     output = ''
     try:
-        result = await Runner.run(data_agent, user_message, session=session)
+        result = await Runner.run(build_data_agent(), user_message, session=get_session())
         output = result.final_output
     except InputGuardrailTripwireTriggered:
         output = "I'd really rather not talk about Tasha."
@@ -9,7 +9,7 @@
 
 # ## Configure client and create Vector Store
 
-import os, re
+import os
 from pathlib import Path
 from openai import OpenAI
 from agents import set_default_openai_key, Agent, Runner, function_tool, ModelSettings, RunConfig
@@ -42,7 +42,8 @@ def get_vector_store_id_by_name(name: str) -> str:
 
 import ast
 import operator as _op
-from typing import Any
+from functools import lru_cache
+from types import CodeType
 
 # --- A safe arithmetic evaluator used by the calculator agent ---
 _ALLOWED_OPS = {
@@ -55,24 +56,27 @@ _ALLOWED_OPS = {
     ast.Mod: _op.mod,
 }
 
-def _eval_ast(node: ast.AST) -> Any:
-    if isinstance(node, ast.Constant):        # type: ignore[attr-defined]
-        return node.value
-    if isinstance(node, ast.UnaryOp) and type(node.op) in _ALLOWED_OPS:
-        return _ALLOWED_OPS[type(node.op)](_eval_ast(node.operand))
-    if isinstance(node, ast.BinOp) and type(node.op) in _ALLOWED_OPS:
-        return _ALLOWED_OPS[type(node.op)](_eval_ast(node.left), _eval_ast(node.right))
-    raise ValueError("Unsupported expression")
+# Characters allowed in an expression; _compile_expression remains the authoritative guard
+_ALLOWED_CHARS = frozenset("0123456789 \t\n()+-*/.^%")
+_ALLOWED_NODES = (ast.Expression, ast.Constant, ast.UnaryOp, ast.BinOp, *_ALLOWED_OPS)
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str) -> CodeType:
+    """Validate the AST against the allowlist, then compile it to bytecode (cached per expression)."""
+    tree = ast.parse(expr, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError("Unsupported expression")
+    return compile(tree, "<calc>", "eval")
 
 @function_tool
 def eval_expression(expression: str) -> str:
     """Safely evaluate an arithmetic expression using + - * / % ** and parentheses."""
     expr = expression.strip().replace("^", "**")
-    if not re.fullmatch(r"[\d\s\(\)\+\-\*/\.\^%]+", expr):
+    if not expr or not _ALLOWED_CHARS.issuperset(expr):
         return "Error: arithmetic only"
     try:
-        tree = ast.parse(expr, mode="eval")
-        return str(_eval_ast(tree.body))  # type: ignore[attr-defined]
+        return str(eval(_compile_expression(expr), {"__builtins__": {}}, {}))
     except Exception as e:
         return f"Error: {e}"
 
@@ -98,7 +102,6 @@ calculator_agent = Agent(
 
 from pydantic import BaseModel
 from typing import List, Union
-import re
 
 from agents import (
     Agent,
@@ -20,24 +20,33 @@ client = OpenAI(api_key=api_key)
 set_default_openai_key(api_key)
 
 # --- Prepare small sample corpus for Lt. Commander Data ---
-CORPUS_PATH = "./data_lines.txt"
+CORPUS_PATHS = ["./data_lines.txt"]
+BATCH_SIZE = 500  # max files per vector store file batch
+
+# Data lines are short quotes: smaller chunks than the 800/400 default give
+# tighter matches and fewer tokens per file_search result
+CHUNKING_STRATEGY = {
+    "type": "static",
+    "static": {"max_chunk_size_tokens": 400, "chunk_overlap_tokens": 100},
+}
 
 # --- Create a transient vector store and upload corpus ---
 vs = client.vector_stores.create(name="Data Lines Vector Store")
 
-# 1) Upload to Files API
-uploaded = client.files.create(
-    file=open(CORPUS_PATH, "rb"),
-    purpose="assistants",                # important
-)
-
-# 2) Attach & poll on the vector store
-vs_file = client.vector_stores.files.create_and_poll(
-    vector_store_id=vs.id,
-    file_id=uploaded.id,
-)
-print("vs_file.status:", vs_file.status)
-print("vs_file.last_error:", getattr(vs_file, "last_error", None))
+# Upload, attach & poll each batch of files in one API call
+for start in range(0, len(CORPUS_PATHS), BATCH_SIZE):
+    files = [open(path, "rb") for path in CORPUS_PATHS[start:start + BATCH_SIZE]]
+    try:
+        batch = client.vector_stores.file_batches.upload_and_poll(
+            vector_store_id=vs.id,
+            files=files,
+            chunking_strategy=CHUNKING_STRATEGY,  # applies to the files added here
+        )
+    finally:
+        for f in files:
+            f.close()
+    print("batch.status:", batch.status)
+    print("batch.file_counts:", batch.file_counts)
 
 # # --- Function to delete the created Vector Store ---
 # def delete_vector_store(vector_store_id: str):
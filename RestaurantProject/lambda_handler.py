@@ -1,18 +1,38 @@
 import boto3
 import json
+from botocore.config import Config
+
+# Created once per execution environment and reused by warm invocations
+agent_client = boto3.client(
+    'bedrock-agentcore',
+    region_name='eu-central-1',
+    config=Config(connect_timeout=1, read_timeout=60, retries={'max_attempts': 2}, tcp_keepalive=True)
+)
+
+# Static responses are built once; the handler returns them as-is (do not mutate)
+_PREFLIGHT_RESPONSE = {
+    "statusCode": 200,
+    "headers": {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "Content-Type",
+        "Access-Control-Allow-Methods": "OPTIONS,POST,GET"
+    },
+    "body": ""
+}
+
+_MISSING_FIELDS_RESPONSE = {
+    "statusCode": 400,
+    "body": json.dumps({"message": "Both 'prompt' and 'sessionId' are required."}),
+    "headers": {
+        "Content-Type": "application/json",
+        "Access-Control-Allow-Origin": "*"
+    }
+}
 
 def lambda_handler(event, context):
     # Preflight request (OPTIONS) için cevap
     if event.get("httpMethod") == "OPTIONS":
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Content-Type",
-                "Access-Control-Allow-Methods": "OPTIONS,POST,GET"
-            },
-            "body": ""
-        }
+        return _PREFLIGHT_RESPONSE
 
     try:
         body = json.loads(event.get("body", "{}"))
@@ -20,19 +40,11 @@ def lambda_handler(event, context):
         session_id = body.get("sessionId")
 
         if not prompt or not session_id:
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"message": "Both 'prompt' and 'sessionId' are required."}),
-                "headers": {
-                    "Content-Type": "application/json",
-                    "Access-Control-Allow-Origin": "*"
-                }
-            }
+            return _MISSING_FIELDS_RESPONSE
 
-        client = boto3.client('bedrock-agentcore', region_name='eu-central-1')
         payload = json.dumps({"prompt": prompt})
 
-        response = client.invoke_agent_runtime(
+        response = agent_client.invoke_agent_runtime(
             agentRuntimeArn='arn:aws:bedrock-agentcore:eu-central-1:058264126563:runtime/multi_agent_restaurant-wg3fXH8MuC',
             runtimeSessionId=session_id,
             payload=payload,
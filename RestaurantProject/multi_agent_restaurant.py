@@ -2,9 +2,12 @@
 # coding: utf-8
 
 import os
-import json
+import csv
+import asyncio
 import boto3
-import pandas as pd
+import orjson
+from botocore.config import Config
+from functools import lru_cache
 from io import StringIO
 from openai import OpenAI
 from agents import (
@@ -29,49 +32,61 @@ set_default_openai_key(api_key)
 
 # Add s3 permission to bedrock agent core role
 S3_BUCKET = "kntbucket"
-s3_client = boto3.client("s3", region_name="eu-central-1")
+s3_client = boto3.client("s3", region_name="eu-central-1", config=Config(tcp_keepalive=True))
 
 # ---------------------------
 # TOOLS
 # ---------------------------
-@function_tool
-def list_restaurants(city: str, fine_dine: str) -> str:
-    response = s3_client.get_object(Bucket=S3_BUCKET, Key="restaurant.csv")
+# The catalog CSVs are static, so parse and normalize each one once per
+# container and index the rows by city; tool calls are then dict lookups.
+@lru_cache(maxsize=8)
+def _load_catalog(key: str, city_column: str, normalize: tuple = ()) -> dict:
+    response = s3_client.get_object(Bucket=S3_BUCKET, Key=key)
     csv_data = response["Body"].read().decode("utf-8")
-    df = pd.read_csv(StringIO(csv_data))
-    df["City"] = df["City"].str.strip().str.lower()
-    df["Fine Dining"] = df["Fine Dining"].str.strip().str.lower()
+    reader = csv.DictReader(StringIO(csv_data))
+    cols = normalize or tuple(reader.fieldnames or ())
+    by_city = {}
+    for row in reader:
+        for col in cols:
+            row[col] = row[col].strip().lower()
+        by_city.setdefault(row[city_column], []).append(row)
+    return by_city
+
+def _rows_for_city(by_city: dict, city: str) -> list:
     if city:
-        df = df[df["City"] == city.strip().lower()]
+        return by_city.get(city.strip().lower(), [])
+    return [row for rows in by_city.values() for row in rows]
+
+def _to_json(rows: list) -> str:
+    # orjson output is compact UTF-8, keeping the tool payload (and the LLM tokens) small
+    return orjson.dumps(rows).decode()
+
+# The tools are async (S3 reads run off the event loop) so a cold catalog load
+# doesn't stall other agents running concurrently, and the SDK can run
+# listHotels and listAirbnbs concurrently when both are requested.
+@function_tool
+async def list_restaurants(city: str, fine_dine: str) -> str:
+    by_city = await asyncio.to_thread(_load_catalog, "restaurant.csv", "City", ("City", "Fine Dining"))
+    rows = _rows_for_city(by_city, city)
     if fine_dine:
-        df = df[df["Fine Dining"] == fine_dine.strip().lower()]
-    return json.dumps(df.to_dict(orient="records"), default=str)
+        fine_dine = fine_dine.strip().lower()
+        rows = [r for r in rows if r["Fine Dining"] == fine_dine]
+    return _to_json(rows)
 
 @function_tool
-def list_hotels(city: str) -> str:
-    response = s3_client.get_object(Bucket=S3_BUCKET, Key="hotel.csv")
-    csv_data = response["Body"].read().decode("utf-8")
-    df = pd.read_csv(StringIO(csv_data))
-    df["Location"] = df["Location"].str.strip().str.lower()
-    df = df[df["Location"] == city.strip().lower()]
-    return json.dumps(df.to_dict(orient="records"), default=str)
+async def list_hotels(city: str) -> str:
+    by_city = await asyncio.to_thread(_load_catalog, "hotel.csv", "Location", ("Location",))
+    return _to_json(by_city.get(city.strip().lower(), []))
 
 @function_tool
-def list_airbnbs(city: str, pets: str, pool: str, sauna: str) -> str:
-    response = s3_client.get_object(Bucket=S3_BUCKET, Key="airbnb.csv")
-    csv_data = response["Body"].read().decode("utf-8")
-    df = pd.read_csv(StringIO(csv_data))
-    str_cols = df.select_dtypes(include=["object", "string"]).columns
-    df[str_cols] = df[str_cols].apply(lambda col: col.str.strip().str.lower(), axis=0)
-    if city:
-        df = df[df["Location"] == city.strip().lower()]
-    if pets:
-        df = df[df["Pets"] == pets.strip().lower()]
-    if pool:
-        df = df[df["Pool"] == pool.strip().lower()]
-    if sauna:
-        df = df[df["Sauna"] == sauna.strip().lower()]
-    return json.dumps(df.to_dict(orient="records"), default=str)
+async def list_airbnbs(city: str, pets: str, pool: str, sauna: str) -> str:
+    by_city = await asyncio.to_thread(_load_catalog, "airbnb.csv", "Location")
+    rows = _rows_for_city(by_city, city)
+    for col, value in (("Pets", pets), ("Pool", pool), ("Sauna", sauna)):
+        if value:
+            value = value.strip().lower()
+            rows = [r for r in rows if r[col] == value]
+    return _to_json(rows)
 
 
 # ---------------------------
@@ -163,15 +178,36 @@ If any details are missing, prompt the user for more info before calling the col
     model_settings=ModelSettings(model_name="gpt-4o-mini", temperature=0)
 )
 
+# Handoffs run one agent at a time, so requests that need both agents go
+# through this tool, which runs them concurrently.
+@function_tool
+async def find_restaurants_and_accommodation(restaurant_request: str, accommodation_request: str) -> str:
+    """Ask the Restaurant Agent and the Accommodation Agent at the same time.
+
+    Args:
+        restaurant_request: The user's restaurant request (city, fine dining Yes/No).
+        accommodation_request: The user's accommodation request (hotel or Airbnb, city, pets, pool, sauna).
+    """
+    restaurants, accommodation = await asyncio.gather(
+        Runner.run(restaurant_agent, restaurant_request),
+        Runner.run(accommodation_agent, accommodation_request),
+    )
+    return orjson.dumps({
+        "restaurants": str(restaurants.final_output),
+        "accommodation": str(accommodation.final_output),
+    }).decode()
+
 supervisor_agent = Agent(
     name="Supervisor Agent",
     instructions=f"""
 {RECOMMENDED_PROMPT_PREFIX}
 You are the Supervisor.
+If user asks about both restaurants and accommodation → call find_restaurants_and_accommodation once with both requests.
 If user asks about restaurants → HAND OFF to Restaurant Agent.
 If user asks about accommodation → HAND OFF to Accommodation Agent.
 Otherwise say: I can't help you, I only handle restaurants and accommodation.
 """,
+    tools=[find_restaurants_and_accommodation],
     handoffs=[restaurant_agent, accommodation_agent],
     model_settings=ModelSettings(model_name="gpt-4o-mini", temperature=0)
 )